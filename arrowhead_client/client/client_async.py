@@ -1,10 +1,11 @@
-import traceback
+import asyncio
 import arrowhead_client.client.core_service_forms.client
 from arrowhead_client import errors as errors
 from arrowhead_client.client import core_service_responses as responses
-from arrowhead_client.client.client_core import ArrowheadClient
+from arrowhead_client.client.client_core import ArrowheadClient, JSON_HEADERS
 from arrowhead_client.client.core_services import CoreServices
 from arrowhead_client.service import Service
+from arrowhead_client.rules import RegistrationRule
 from arrowhead_client.provider.implementations.fastapi_provider import FastapiProvider
 from arrowhead_client.response import Response, ConnectionResponse
 from arrowhead_client.constants import OrchestrationFlags
@@ -21,14 +22,7 @@ class ArrowheadClientAsync(ArrowheadClient):
         self.provider.add_shutdown_routine(self.client_cleanup)
 
     async def consume_service(self, service_definition, **kwargs) -> Response:
-        rule = self.orchestration_rules.get(service_definition)
-        if rule is None:
-            # TODO: Not sure if this should raise an error or just log?
-            raise errors.NoAvailableServicesError(
-                    f'No services available for'
-                    f' service \'{service_definition}\''
-            )
-        res = await self.consumer.consume_service(rule, **kwargs)  # type: ignore
+        res = await self._get_consume_fn(service_definition)(**kwargs)
         return res
 
     async def connect(self, service_definition, **kwargs) -> ConnectionResponse:
@@ -85,70 +79,78 @@ class ArrowheadClientAsync(ArrowheadClient):
         # TODO: Add an argument for arrowhead forms in consume_service, and one for the ssl-files
         orchestration_response = await self.consume_service(
                 CoreServices.ORCHESTRATION.service_definition,
-                json=orchestration_form.dto(),
+                data=orchestration_form.dto_bytes(),
+                headers=JSON_HEADERS,
                 # cert=self.cert,
         )
 
         rules = responses.process_orchestration(orchestration_response, method)
+        if not rules:
+            self._logger.warning(f'No services available for service \'{service_definition}\'')
+            return
 
         for rule in rules:
             self.orchestration_rules.store(rule)
 
     async def _register_service(self, service: Service):
-        service_registration_form = arrowhead_client.client.core_service_forms.client.ServiceRegistrationForm.make(
-                provided_service=service,
-                provider_system=self.system,
-        )
-
         service_registration_response = await self.consume_service(
                 CoreServices.SERVICE_REGISTER.service_definition,
-                json=service_registration_form.dto(),
+                data=self._registration_payload(service),
+                headers=JSON_HEADERS,
         )
 
         responses.process_service_register(service_registration_response)
 
     async def _register_all_services(self):
-        for rule in self.registration_rules:
-            if rule.is_provided:
-                continue
-            try:
-                await self._register_service(rule.provided_service)
-            except errors.CoreServiceInputError as e:
-                if str(e).endswith('already exists.'):
+        pending_rules = [rule for rule in self.registration_rules if not rule.is_provided]
+        results = await asyncio.gather(
+                *(self._register_service(rule.provided_service) for rule in pending_rules),
+                return_exceptions=True,
+        )
+
+        # Every result is handled before re-raising, so successfully registered services can still be unregistered
+        unexpected_error = None
+        for rule, result in zip(pending_rules, results):
+            if isinstance(result, errors.CoreServiceInputError):
+                if str(result).endswith('already exists.'):
                     rule.is_provided = True
                 else:
-                    print(f"ERROR: {__name__} failed to register provider: {e}")
-                    traceback.print_exception(type(e), e, e.__traceback__)
-
+                    self._logger.error(f'Failed to register service \'{rule.service_definition}\': {result}')
+            elif isinstance(result, BaseException):
+                unexpected_error = unexpected_error or result
             else:
                 rule.is_provided = True
 
-    async def _unregister_service(self, service: Service):
-        unregistration_payload = {
-            'service_definition': service.service_definition,
-            'system_name': self.system.system_name,
-            'address': self.system.address,
-            'port': self.system.port,
-        }
+        if unexpected_error is not None:
+            raise unexpected_error
 
+    async def _unregister_service(self, rule: RegistrationRule):
         service_unregistration_response = await self.consume_service(
                 CoreServices.SERVICE_UNREGISTER.service_definition,
-                params=unregistration_payload,
+                params=rule.unregistration_payload,
         )
 
         responses.process_service_unregister(service_unregistration_response)
 
     async def _unregister_all_services(self):
-        for rule in self.registration_rules:
-            if not rule.is_provided:
-                continue
-            try:
-                await self._unregister_service(rule.provided_service)
-            except errors.CoreServiceInputError as e:
-                print(e)
+        provided_rules = [rule for rule in self.registration_rules if rule.is_provided]
+        results = await asyncio.gather(
+                *(self._unregister_service(rule) for rule in provided_rules),
+                return_exceptions=True,
+        )
+
+        unexpected_error = None
+        for rule, result in zip(provided_rules, results):
+            if isinstance(result, errors.CoreServiceInputError):
+                self._logger.warning(f'Failed to unregister service \'{rule.service_definition}\': {result}')
+            elif isinstance(result, BaseException):
+                unexpected_error = unexpected_error or result
             else:
                 rule.is_provided = False
 
+        if unexpected_error is not None:
+            raise unexpected_error
+
     def run_forever(self):
         self.provider.run_forever(
                 address=self.system.address,
@@ -163,6 +165,7 @@ class ArrowheadClientAsync(ArrowheadClient):
         if self.secure:
             authorization_response = await self.consume_service(CoreServices.PUBLICKEY.service_definition)
             self.auth_authentication_info = responses.process_publickey(authorization_response)
+            self._bind_access_policies()
         self._initialize_provided_services()
         await self._register_all_services()
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from functools import partial
 from typing import Any, Dict, Tuple, Callable, Type, List, Optional
 from abc import ABC, abstractmethod
@@ -9,15 +10,20 @@ from arrowhead_client.provider.base import BaseProvider
 from arrowhead_client.consumer.base import BaseConsumer
 from arrowhead_client.service import Service, ServiceInterface
 from arrowhead_client.client.core_services import get_core_rules
+from arrowhead_client.client.core_service_forms.client import ServiceRegistrationForm
 from arrowhead_client.logs import get_logger
 from arrowhead_client.client.core_system_defaults import config as ar_config
 from arrowhead_client.security.access_policy import get_access_policy
 from arrowhead_client.rules import (
+    OrchestrationRule,
     OrchestrationRuleContainer,
     RegistrationRuleContainer,
     RegistrationRule,
 )
 from arrowhead_client import constants
+from arrowhead_client import errors
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
 
 
 def provided_service(
@@ -67,6 +73,8 @@ def provided_service(
                 return list(reversed(input))
     """
 
+    service_definition = sys.intern(service_definition)
+
     class ServiceDescriptor:
         def __init__(self, func):
             self.service_instance = Service.make(
@@ -147,12 +155,14 @@ class ArrowheadClient(ABC):
         self.provider = provider
         self.keyfile = keyfile
         self.certfile = certfile
+        self._cert: Tuple[str, str] = (certfile, keyfile)
         self.secure = all(self.cert)
         self._logger = logger
         self.config = config or ar_config
         self.auth_authentication_info = None
-        self.orchestration_rules = OrchestrationRuleContainer()
+        self.orchestration_rules = OrchestrationRuleContainer(bind=self._bind_consumer)
         self.registration_rules = RegistrationRuleContainer()
+        self._registration_payloads: Dict[str, Tuple[Service, bytes]] = {}
         # TODO: Should add_provided_service be exactly the same as the provider's,
         # or should this class do something on top of it?
         # It's currently not even being used so it could likely be removed.
@@ -166,7 +176,7 @@ class ArrowheadClient(ABC):
     @property
     def cert(self) -> Tuple[str, str]:
         """ Tuple of the keyfile and certfile """
-        return self.certfile, self.keyfile
+        return self._cert
 
     def setup(self):
         # Setup methods
@@ -211,7 +221,7 @@ class ArrowheadClient(ABC):
         """
 
         provided_service = Service(
-                service_definition,
+                sys.intern(service_definition),
                 service_uri,
                 ServiceInterface.with_access_policy(
                         protocol,
@@ -390,12 +400,12 @@ class ArrowheadClient(ABC):
         pass
 
     @abstractmethod
-    def _unregister_service(self, service):
+    def _unregister_service(self, rule):
         """
         Unregisters the given provided_service with provided_service registry
 
         Args:
-            service: Service to unregister with the Service registry.
+            rule: Registration rule of the service to unregister with the Service registry.
         """
         pass
 
@@ -406,14 +416,91 @@ class ArrowheadClient(ABC):
         """
         pass
 
+    def _bind_consumer(self, rule: OrchestrationRule) -> Callable:
+        """
+        Binds the orchestration rule to the consumer.
+
+        :py:attr:`orchestration_rules` keeps the bound function next to the rule, so
+        :py:meth:`consume_service` does not need to look up the rule on every call.
+        The consumer is read when the bound function is called, so replacing
+        :py:attr:`consumer` also affects rules that are already stored.
+
+        Args:
+            rule: Orchestration rule to bind.
+        """
+
+        def consume(**kwargs):
+            return self.consumer.consume_service(rule, **kwargs)
+
+        return consume
+
+    def _get_consume_fn(self, service_definition: str) -> Callable:
+        """
+        Returns the consumer function bound to the orchestration rule of ``service_definition``.
+
+        Args:
+            service_definition: The provided_service definition of a consumable provided_service
+        Raises:
+            NoAvailableServicesError: If no orchestration rule exists for ``service_definition``.
+        """
+        consume_fn = self.orchestration_rules.bound(sys.intern(service_definition))
+        if consume_fn is None:
+            # TODO: Not sure if this should raise an error or just log?
+            raise errors.NoAvailableServicesError(
+                    f'No services available for'
+                    f' service \'{service_definition}\''
+            )
+
+        return consume_fn
+
+    def _registration_payload(self, service: Service) -> bytes:
+        """
+        Returns the service registration payload for ``service``.
+
+        The payload is built once per service object, repeated registrations of the
+        same service reuse the cached JSON payload. A new service object stored under
+        the same service definition replaces the cached payload.
+
+        Args:
+            service: Service to register with the Service registry.
+        Returns:
+            JSON encoded service registration form.
+        """
+        cached_service, registration_payload = self._registration_payloads.get(
+                service.service_definition,
+                (None, b''),
+        )
+        if cached_service is not service:
+            registration_payload = ServiceRegistrationForm.make(
+                    provided_service=service,
+                    provider_system=self.system,
+            ).dto_bytes()
+            self._registration_payloads[service.service_definition] = (service, registration_payload)
+
+        return registration_payload
+
+    def _bind_access_policies(self) -> None:
+        """
+        Creates the access policy of every registration rule.
+
+        Runs when the authorization public key is received, the policies are then reused by
+        :py:meth:`_initialize_provided_services`.
+        """
+        for rule in self.registration_rules:
+            self._bind_access_policy(rule)
+
+    def _bind_access_policy(self, rule: RegistrationRule) -> None:
+        rule.access_policy = get_access_policy(
+                policy_name=rule.provided_service.access_policy,
+                provided_service=rule.provided_service,
+                privatekey=self.keyfile,
+                authorization_key=self.auth_authentication_info
+        )
+
     def _initialize_provided_services(self) -> None:
         for rule in self.registration_rules:
-            rule.access_policy = get_access_policy(
-                    policy_name=rule.provided_service.access_policy,
-                    provided_service=rule.provided_service,
-                    privatekey=self.keyfile,
-                    authorization_key=self.auth_authentication_info
-            )
+            if rule.access_policy is None:
+                self._bind_access_policy(rule)
             self.provider.add_provided_service(rule)
 
     def _core_service_setup(self) -> None:
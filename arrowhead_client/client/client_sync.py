@@ -1,13 +1,13 @@
 from typing import Optional
-import warnings
 
 import arrowhead_client.client.core_service_forms.client as forms
 from arrowhead_client import errors as errors
 from arrowhead_client.constants import OrchestrationFlags
 from arrowhead_client.client import core_service_responses as responses
-from arrowhead_client.client.client_core import ArrowheadClient
+from arrowhead_client.client.client_core import ArrowheadClient, JSON_HEADERS
 from arrowhead_client.client.core_services import CoreServices
 from arrowhead_client.service import Service, ServiceInterface
+from arrowhead_client.rules import RegistrationRule
 
 class ArrowheadClientSync(ArrowheadClient):
     """
@@ -30,15 +30,7 @@ class ArrowheadClientSync(ArrowheadClient):
             **kwargs: Collection of keyword arguments passed to the consumer.
         """
 
-        rule = self.orchestration_rules.get(service_definition)
-        if rule is None:
-            # TODO: Not sure if this should raise an error or just log?
-            raise errors.NoAvailableServicesError(
-                    f'No services available for'
-                    f' service \'{service_definition}\''
-            )
-
-        return self.consumer.consume_service(rule, **kwargs, )
+        return self._get_consume_fn(service_definition)(**kwargs)
 
     def add_orchestration_rule(
             self,
@@ -77,14 +69,17 @@ class ArrowheadClientSync(ArrowheadClient):
                 **kwargs
         )
 
-        # TODO: Add an argument for arrowhead forms in consume_service, and one for the ssl-files
+        # TODO: Add an argument for arrowhead forms in consume_service
         orchestration_response = self.consume_service(
                 CoreServices.ORCHESTRATION.service_definition,
-                json=orchestration_form.dto(),
-                cert=self.cert,
+                data=orchestration_form.dto_bytes(),
+                headers=JSON_HEADERS,
         )
 
         rules = responses.process_orchestration(orchestration_response, method)
+        if not rules:
+            self._logger.warning(f'No services available for service \'{service_definition}\'')
+            return
 
         for rule in rules:
             self.orchestration_rules.store(rule)
@@ -101,6 +96,7 @@ class ArrowheadClientSync(ArrowheadClient):
             if self.secure:
                 authorization_response = self.consume_service(CoreServices.PUBLICKEY.service_definition)
                 self.auth_authentication_info = responses.process_publickey(authorization_response)
+                self._bind_access_policies()
             self._initialize_provided_services()
             self._register_all_services()
             self._logger.info('Starting server')
@@ -127,15 +123,10 @@ class ArrowheadClientSync(ArrowheadClient):
             service: Service to register with the Service registry.
         """
 
-        service_registration_form = forms.ServiceRegistrationForm.make(
-                provided_service=service,
-                provider_system=self.system,
-        )
-
         service_registration_response = self.consume_service(
                 CoreServices.SERVICE_REGISTER.service_definition,
-                json=service_registration_form.dto(),
-                cert=self.cert
+                data=self._registration_payload(service),
+                headers=JSON_HEADERS,
         )
 
         responses.process_service_register(
@@ -150,33 +141,21 @@ class ArrowheadClientSync(ArrowheadClient):
             try:
                 self._register_service(rule.provided_service)
             except errors.CoreServiceInputError as e:
-                # TODO: Do logging
-                print(e)
+                self._logger.error(f'Failed to register service \'{rule.service_definition}\': {e}')
             else:
                 rule.is_provided = True
 
-    def _unregister_service(self, service: Service) -> None:
+    def _unregister_service(self, rule: RegistrationRule) -> None:
         """
         Unregisters the given provided_service with provided_service registry
 
         Args:
-            service: Service to unregister with the Service registry.
+            rule: Registration rule of the service to unregister with the Service registry.
         """
 
-        service_definition = service.service_definition
-
-        # TODO: Should be a "form"?
-        unregistration_payload = {
-            'service_definition': service_definition,
-            'system_name': self.system.system_name,
-            'address': self.system.address,
-            'port': self.system.port
-        }
-
         service_unregistration_response = self.consume_service(
                 CoreServices.SERVICE_UNREGISTER.service_definition,
-                params=unregistration_payload,
-                cert=self.cert
+                params=rule.unregistration_query,
         )
 
         responses.process_service_unregister(service_unregistration_response)
@@ -190,8 +169,8 @@ class ArrowheadClientSync(ArrowheadClient):
             if not rule.is_provided:
                 continue
             try:
-                self._unregister_service(rule.provided_service)
+                self._unregister_service(rule)
             except errors.CoreServiceInputError as e:
-                print(e)
+                self._logger.warning(f'Failed to unregister service \'{rule.service_definition}\': {e}')
             else:
                 rule.is_provided = False
@@ -39,7 +39,7 @@ class AiohttpConsumer(BaseConsumer, protocol=constants.Protocol.HTTP):
             rule: OrchestrationRule,
             **kwargs,
     ) -> Response:
-        headers = kwargs.get('headers', {})
+        headers = kwargs.pop('headers', {})
         if rule.secure:
             auth_header = {'Authorization': f'Bearer {rule.authorization_token}'}
             headers = {**headers, **auth_header}
@@ -61,7 +61,7 @@ class AiohttpConsumer(BaseConsumer, protocol=constants.Protocol.HTTP):
             rule: OrchestrationRule,
             **kwargs,
     ) -> "WebSocketResponse":
-        headers = kwargs.get('headers', {})
+        headers = kwargs.pop('headers', {})
         if rule.secure:
             auth_header = {'Authorization': f'Bearer {rule.authorization_token}'}
             headers = {**headers, **auth_header}
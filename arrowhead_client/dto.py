@@ -6,14 +6,23 @@ Contains the :py:class:`~arrowhead_client.dto.DTOMixin` class.
 """
 import re
 from abc import ABC
+from functools import lru_cache
+from typing import Any
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 from pydantic.v1 import BaseModel
-from pydantic.v1.json import timedelta_isoformat, isoformat
+from pydantic.v1.json import timedelta_isoformat, isoformat, custom_pydantic_encoder
 
 from arrowhead_client.service import ServiceInterface
 
+_CAMEL_RE = re.compile(r'[A-Z][a-z0-9]*|[a-z0-9]+')
 
+
+@lru_cache(maxsize=512)
 def to_camel_case(variable_name: str) -> str:
     """
     Turns snake_case string into camelCase.
@@ -31,6 +40,7 @@ def to_camel_case(variable_name: str) -> str:
            ''.join([split.capitalize() for split in split_name]) + trailing_underscore
 
 
+@lru_cache(maxsize=512)
 def to_snake_case(variable_name: str) -> str:
     """
     Turns camelCase string into snake_case.
@@ -40,7 +50,7 @@ def to_snake_case(variable_name: str) -> str:
     Returns:
         variable_name in ``snake_case_form``.
     """
-    split_camel = re.findall(r'[A-Z][a-z0-9]*|[a-z0-9]+', variable_name)
+    split_camel = _CAMEL_RE.findall(variable_name)
     initial_underscore = '_' if variable_name.startswith('_') else ''
     trailing_underscore = '_' if variable_name.endswith('_') else ''
 
@@ -48,6 +58,10 @@ def to_snake_case(variable_name: str) -> str:
            '_'.join([camel.lower() for camel in split_camel]) + trailing_underscore
 
 
+def _encode_service_interface(interface: ServiceInterface) -> str:
+    return interface.dto()
+
+
 class DTOMixin(ABC, BaseModel):
     """
     Mixin to create data-transfer objects from class.
@@ -68,7 +82,7 @@ class DTOMixin(ABC, BaseModel):
         json_encoders = {
             datetime: isoformat,
             timedelta: timedelta_isoformat,
-            ServiceInterface: lambda i: 'hello',
+            ServiceInterface: _encode_service_interface,
         }
 
     def dto(self, **kwargs):
@@ -79,6 +93,24 @@ class DTOMixin(ABC, BaseModel):
                 **kwargs,
         )
 
+    def dto_bytes(self, **kwargs) -> bytes:
+        """
+        Serializes the object directly to a JSON encoded payload.
+
+        Uses ``orjson`` if it is installed, otherwise falls back to :py:meth:`json`.
+
+        Returns:
+            The data-transfer object as UTF-8 encoded JSON.
+        """
+        if orjson is None:
+            return self.json(**kwargs).encode()
+
+        return orjson.dumps(
+                self.dto(**kwargs),
+                default=_json_encoder,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
     def json(
             self,
             exclude_defaults=True,
@@ -92,3 +124,7 @@ class DTOMixin(ABC, BaseModel):
                 by_alias=by_alias,
                 **kwargs,
         )
+
+
+def _json_encoder(obj: Any) -> Any:
+    return custom_pydantic_encoder(DTOMixin.__config__.json_encoders, obj)
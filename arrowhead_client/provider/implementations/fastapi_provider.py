@@ -1,8 +1,7 @@
-from typing import Mapping, Dict, Callable
+from typing import Dict, Callable, Mapping
 import json
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
 import uvicorn  # type: ignore
 
 from arrowhead_client.provider.base import BaseProvider
@@ -11,30 +10,58 @@ from arrowhead_client.security.access_policy import TokenAccessPolicy
 from arrowhead_client import constants
 
 
-class ArrowheadAccessPolicyMiddleware(BaseHTTPMiddleware):
+class ArrowheadAccessPolicyASGI:
+    """
+    Pure ASGI middleware checking the access policy of provided HTTP and WebSocket services.
+
+    The check runs before the request reaches FastAPI, so unauthorized consumers are rejected
+    before the request body is read.
+
+    Args:
+        app: ASGI application.
+        policy_map: Mapping from service uri to registration rule.
+    """
+
     def __init__(
             self,
             app,
             policy_map: Mapping[str, RegistrationRule],
     ):
-        super().__init__(app)
+        self.app = app
         self.policy_map = policy_map
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.scope['path'].strip('/')
-        if path not in self.policy_map:
-            return await call_next(request)
+    async def __call__(self, scope, receive, send):
+        if scope['type'] not in ('http', 'websocket'):
+            return await self.app(scope, receive, send)
+
+        rule = self.policy_map.get(scope['path'].strip('/'))
+        if rule is None:
+            return await self.app(scope, receive, send)
         # TODO: Replace these with actual request values when uvicorn implements client-certs or when you try running a reverse proxy
         consumer_cert = 'consumer_cert'
         auth_str = 'auth_str'
 
-        if isinstance(self.policy_map[path].access_policy, TokenAccessPolicy):
-            return Response(content=json.dumps({constants.Misc.ERROR_MESSAGE: 'Token access policy not supported'}),
-                            status_code=501)
-        if not self.policy_map[path].is_authorized(consumer_cert, auth_str):
-            return Response(content=f'{{"{constants.Misc.ERROR_MESSAGE}": "WIP"}}', status_code=403)
+        if isinstance(rule.access_policy, TokenAccessPolicy):
+            status_code, error_message = 501, 'Token access policy not supported'
+        elif not rule.is_authorized(consumer_cert, auth_str):
+            status_code, error_message = 403, 'WIP'
+        else:
+            return await self.app(scope, receive, send)
+
+        if scope['type'] == 'websocket':
+            # Closing before accepting rejects the WebSocket handshake with a 403
+            return await send({'type': 'websocket.close', 'code': 1008})
 
-        return await call_next(request)
+        body = json.dumps({constants.Misc.ERROR_MESSAGE: error_message}).encode()
+        await send({
+            'type': 'http.response.start',
+            'status': status_code,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
 
 
 class FastapiProvider(BaseProvider, protocol=constants.Protocol.HTTP):
@@ -46,6 +73,7 @@ class FastapiProvider(BaseProvider, protocol=constants.Protocol.HTTP):
         super().__init__(cafile)
         self.app = FastAPI()
         self.policy_map: Dict[str, RegistrationRule] = {}
+        self.app.add_middleware(ArrowheadAccessPolicyASGI, policy_map=self.policy_map)
 
     def add_provided_service(self, rule: RegistrationRule, ) -> None:
         self.policy_map[rule.service_uri] = rule
@@ -69,8 +97,6 @@ class FastapiProvider(BaseProvider, protocol=constants.Protocol.HTTP):
             keyfile: str,
             certfile: str,
     ):
-        self.app.add_middleware(ArrowheadAccessPolicyMiddleware, policy_map=self.policy_map)
-
         uvicorn.run(
                 self.app,
                 host=address,
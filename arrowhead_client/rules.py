@@ -3,8 +3,10 @@
 Rules Module
 ============
 """
-from typing import Optional, Iterator, Callable, Dict
+import sys
+from typing import Optional, Iterator, Callable, Dict, List
 from collections.abc import MutableMapping
+from urllib.parse import urlencode
 
 from arrowhead_client.system import ArrowheadSystem
 from arrowhead_client.service import Service
@@ -36,6 +38,9 @@ class OrchestrationRule:
         self._provider_system = provider_system
         self._method = method
         self._authorization_token = authorization_token
+        self._endpoint = f'{provider_system.address}:' \
+                         f'{provider_system.port}/' \
+                         f'{consumed_service.service_uri}'
 
     @property
     def service_definition(self) -> str:
@@ -80,9 +85,7 @@ class OrchestrationRule:
     @property
     def endpoint(self) -> str:
         """The URI to the service, without the protocol"""
-        return f'{self._provider_system.address}:' \
-               f'{self._provider_system.port}/' \
-               f'{self._consumed_service.service_uri}'
+        return self._endpoint
 
     @property
     def authentication_info(self) -> str:
@@ -107,6 +110,17 @@ class RegistrationRule:
     Collection of objects necessary to provide a service.
     """
 
+    __slots__ = (
+        '_provided_service',
+        '_provider_system',
+        '_method',
+        '_func',
+        '_access_policy',
+        '_unregistration_payload',
+        '_unregistration_query',
+        'is_provided',
+    )
+
     def __init__(
             self,
             provided_service: Service,
@@ -127,6 +141,13 @@ class RegistrationRule:
         self._method = method
         self._func = func
         self._access_policy = access_policy
+        self._unregistration_payload = {
+            'service_definition': provided_service.service_definition,
+            'system_name': provider_system.system_name,
+            'address': provider_system.address,
+            'port': provider_system.port,
+        }
+        self._unregistration_query = urlencode(self._unregistration_payload)
         self.is_provided = False
 
     @property
@@ -165,6 +186,16 @@ class RegistrationRule:
     def protocol(self):
         return self._provided_service.interface.protocol
 
+    @property
+    def unregistration_payload(self) -> Dict:
+        """Query parameters used to unregister the service from the :ref:`service-registry`"""
+        return self._unregistration_payload
+
+    @property
+    def unregistration_query(self) -> str:
+        """URL encoded query string used to unregister the service from the :ref:`service-registry`"""
+        return self._unregistration_query
+
     def is_authorized(self, consumer_cert_str: str, auth_str: str):
         try:
             result = self._access_policy.is_authorized(consumer_cert_str, auth_str)  # type: ignore
@@ -179,10 +210,18 @@ class OrchestrationRuleContainer(MutableMapping):
     Orchestration Rule Container.
 
     This class is a thin wrapper around a dictionary, except for the :py:meth:`OrchestrationRuleContainer.store` method.
+
+    If ``bind`` is given, it is called with every rule put into the container and the result is kept
+    alongside the rule until the rule is replaced or deleted, see :py:meth:`OrchestrationRuleContainer.bound`.
+
+    Args:
+        bind: Optional function turning an orchestration rule into a callable.
     """
 
-    def __init__(self):
+    def __init__(self, bind: Optional[Callable[[OrchestrationRule], Callable]] = None):
         self._rulecontainer: Dict[str, OrchestrationRule] = {}
+        self._bind = bind
+        self._bound: Dict[str, Callable] = {}
 
     def __getitem__(self, key: str) -> OrchestrationRule:
         return self._rulecontainer[key]
@@ -192,10 +231,14 @@ class OrchestrationRuleContainer(MutableMapping):
             key: str,
             item: OrchestrationRule
     ) -> None:
+        key = sys.intern(key)
         self._rulecontainer[key] = item
+        if self._bind is not None:
+            self._bound[key] = self._bind(item)
 
     def __delitem__(self, key: str) -> None:
         del self._rulecontainer[key]
+        self._bound.pop(key, None)
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._rulecontainer)
@@ -210,25 +253,44 @@ class OrchestrationRuleContainer(MutableMapping):
         Args:
             item: OrchestrationRule to be stored.
         """
-        self._rulecontainer[item.service_definition] = item
+        self[item.service_definition] = item
+
+    def bound(self, key: str) -> Optional[Callable]:
+        """
+        Returns the result of ``bind`` for the rule stored under ``key``.
+
+        Args:
+            key: Service definition of the rule.
+        Returns:
+            The bound callable, or ``None`` if no rule is stored under ``key`` or the container has no ``bind`` function.
+        """
+        return self._bound.get(key)
 
 
 class RegistrationRuleContainer:
     """
     Registration Rule Container
+
+    Rules are kept in a list in insertion order, with an index mapping service definitions to list positions.
     """
 
     def __init__(self):
-        self._rulecontainer: Dict[str, RegistrationRule] = {}
+        self._rules: List[RegistrationRule] = []
+        self._index: Dict[str, int] = {}
 
     def __iter__(self) -> Iterator[RegistrationRule]:
-        return iter(self._rulecontainer.values())
+        return iter(self._rules)
 
     def __len__(self):
-        return len(self._rulecontainer)
+        return len(self._rules)
 
     def store(self, item: RegistrationRule):
-        self._rulecontainer[item.service_definition] = item
+        position = self._index.get(item.service_definition)
+        if position is None:
+            self._index[item.service_definition] = len(self._rules)
+            self._rules.append(item)
+        else:
+            self._rules[position] = item
 
     def retrieve(self, service_definition: str):
-        return self._rulecontainer[service_definition]
+        return self._rules[self._index[service_definition]]
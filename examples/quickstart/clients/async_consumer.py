@@ -20,9 +20,15 @@ async def main(consumer):
         await consumer.add_orchestration_rule('hello-arrowhead', 'GET')
         await consumer.add_orchestration_rule('echo', 'PUT')
 
+        service_requests = [
+            ('hello-arrowhead', {}),
+            ('echo', {'json': {'msg': 'echo'}}),
+        ] * 3
+
+        # A new coroutine is created for every request, a coroutine can only be awaited once
         aws = [
-            consumer.consume_service('hello-arrowhead'),
-            consumer.consume_service('echo', json={'msg': 'echo'})
+            consumer.consume_service(service_definition, **kwargs)
+            for service_definition, kwargs in service_requests
         ]
 
         for i, aw in enumerate(asyncio.as_completed(aws)):
@@ -0,0 +1,183 @@
+import asyncio
+import json
+
+import pytest
+
+from arrowhead_client import errors
+from arrowhead_client.client.implementations import SyncClient, AsyncClient
+from arrowhead_client.consumer.implementations.requests_consumer import RequestsConsumer
+from arrowhead_client.rules import OrchestrationRule
+from arrowhead_client.security.access_policy import UnrestrictedAccessPolicy
+from arrowhead_client.service import Service
+from arrowhead_client.system import ArrowheadSystem
+
+
+def test_registration_payload_is_cached():
+    test_client = SyncClient.create('test_client', '127.0.0.1', 1337)
+    service = Service.make(
+            'hello-arrowhead',
+            'hello',
+            'HTTP',
+            'NOT_SECURE',
+            'JSON',
+    )
+
+    first_payload = test_client._registration_payload(service)
+    second_payload = test_client._registration_payload(service)
+
+    assert first_payload is second_payload
+    assert json.loads(first_payload)['serviceDefinition'] == 'hello-arrowhead'
+    assert json.loads(first_payload)['interfaces'] == ['HTTP-INSECURE-JSON']
+
+
+def test_registration_payload_of_replaced_service():
+    test_client = SyncClient.create('test_client', '127.0.0.1', 1337)
+    service = Service.make('hello-arrowhead', 'hello', 'HTTP', 'NOT_SECURE', 'JSON')
+    replacement_service = Service.make('hello-arrowhead', 'new_hello', 'HTTP', 'NOT_SECURE', 'TEXT')
+
+    test_client._registration_payload(service)
+    payload = json.loads(test_client._registration_payload(replacement_service))
+
+    assert payload['serviceUri'] == 'new_hello'
+    assert payload['interfaces'] == ['HTTP-INSECURE-TEXT']
+
+
+def make_orchestration_rule(service_uri):
+    return OrchestrationRule(
+            Service.make('hello-arrowhead', service_uri, 'HTTP', 'NOT_SECURE', 'JSON'),
+            ArrowheadSystem.make('provider', '127.0.0.1', 1338),
+            'GET',
+    )
+
+
+def test_consume_service_uses_bound_rule():
+    test_client = SyncClient.create('test_client', '127.0.0.1', 1337)
+    test_client.consumer.consume_service = lambda rule, **kwargs: (rule, kwargs)
+    rule = make_orchestration_rule('hello')
+
+    test_client.orchestration_rules.store(rule)
+
+    assert test_client.consume_service('hello-arrowhead', json={}) == (rule, {'json': {}})
+
+
+def test_consume_service_after_rule_is_replaced():
+    test_client = SyncClient.create('test_client', '127.0.0.1', 1337)
+    test_client.consumer.consume_service = lambda rule, **kwargs: rule
+    new_rule = make_orchestration_rule('new_hello')
+
+    test_client.orchestration_rules.store(make_orchestration_rule('hello'))
+    test_client.orchestration_rules.store(new_rule)
+
+    assert test_client.consume_service('hello-arrowhead') is new_rule
+
+
+def test_consume_service_after_rule_is_deleted():
+    test_client = SyncClient.create('test_client', '127.0.0.1', 1337)
+    test_client.consumer.consume_service = lambda rule, **kwargs: rule
+
+    test_client.orchestration_rules.store(make_orchestration_rule('hello'))
+    del test_client.orchestration_rules['hello-arrowhead']
+
+    with pytest.raises(errors.NoAvailableServicesError):
+        test_client.consume_service('hello-arrowhead')
+
+
+def test_consume_service_without_rule():
+    test_client = SyncClient.create('test_client', '127.0.0.1', 1337)
+
+    with pytest.raises(errors.NoAvailableServicesError):
+        test_client.consume_service('hello-arrowhead')
+
+
+def test_async_register_all_services_concurrently():
+    test_client = AsyncClient.create('test_client', '127.0.0.1', 1337)
+    in_flight = []
+
+    @test_client.provided_service('first', 'first', 'HTTP', 'GET', 'JSON', 'NOT_SECURE')
+    async def first():
+        pass
+
+    @test_client.provided_service('second', 'second', 'HTTP', 'GET', 'JSON', 'NOT_SECURE')
+    async def second():
+        pass
+
+    async def fake_register_service(service):
+        in_flight.append(service.service_definition)
+        await asyncio.sleep(0)
+        assert len(in_flight) == 2
+        if service.service_definition == 'second':
+            raise errors.CoreServiceInputError('Service already exists.')
+
+    test_client._register_service = fake_register_service
+
+    asyncio.run(test_client._register_all_services())
+
+    assert all(rule.is_provided for rule in test_client.registration_rules)
+
+
+def test_initialize_provided_services_reuses_bound_access_policy():
+    test_client = SyncClient.create('test_client', '127.0.0.1', 1337)
+
+    @test_client.provided_service('hello-arrowhead', 'hello', 'HTTP', 'GET', 'JSON', 'NOT_SECURE')
+    def hello(request):
+        pass
+
+    test_client._bind_access_policies()
+    rule = test_client.registration_rules.retrieve('hello-arrowhead')
+    bound_policy = rule.access_policy
+
+    test_client._initialize_provided_services()
+
+    assert isinstance(bound_policy, UnrestrictedAccessPolicy)
+    assert rule.access_policy is bound_policy
+
+
+def test_async_register_and_unregister_all_services_with_unexpected_error():
+    test_client = AsyncClient.create('test_client', '127.0.0.1', 1337)
+
+    @test_client.provided_service('first', 'first', 'HTTP', 'GET', 'JSON', 'NOT_SECURE')
+    async def first():
+        pass
+
+    @test_client.provided_service('second', 'second', 'HTTP', 'GET', 'JSON', 'NOT_SECURE')
+    async def second():
+        pass
+
+    first_rule = test_client.registration_rules.retrieve('first')
+    second_rule = test_client.registration_rules.retrieve('second')
+
+    async def fake_register_service(service):
+        if service.service_definition == 'first':
+            raise ConnectionError
+
+    async def fake_unregister_service(rule):
+        if rule.service_definition == 'first':
+            raise ConnectionError
+
+    test_client._register_service = fake_register_service
+    test_client._unregister_service = fake_unregister_service
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(test_client._register_all_services())
+
+    assert not first_rule.is_provided
+    assert second_rule.is_provided
+
+    first_rule.is_provided = True
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(test_client._unregister_all_services())
+
+    assert first_rule.is_provided
+    assert not second_rule.is_provided
+
+
+def test_consume_service_after_consumer_is_replaced():
+    test_client = SyncClient.create('test_client', '127.0.0.1', 1337)
+    rule = make_orchestration_rule('hello')
+    test_client.orchestration_rules.store(rule)
+
+    test_client.consumer = RequestsConsumer('', '', '')
+    test_client.consumer.consume_service = lambda rule, **kwargs: rule
+
+    assert test_client.consume_service('hello-arrowhead') is rule
@@ -1,6 +1,11 @@
 from arrowhead_client.system import ArrowheadSystem
 from arrowhead_client.service import Service, ServiceInterface
-from arrowhead_client.rules import OrchestrationRule, OrchestrationRuleContainer
+from arrowhead_client.rules import (
+    OrchestrationRule,
+    OrchestrationRuleContainer,
+    RegistrationRule,
+    RegistrationRuleContainer,
+)
 
 provider_system = ArrowheadSystem.make('test', '127.0.0.1', 1337, '')
 consumed_service = Service(
@@ -59,3 +64,33 @@ def test_orchestration_rule_container_rule_input():
         a = key
 
 
+def test_registration_rule_container_store_replaces():
+    rule_container = RegistrationRuleContainer()
+    first_rule = RegistrationRule(consumed_service, provider_system, method, lambda: None)
+    other_rule = RegistrationRule(
+            Service('other', 'other', ServiceInterface('HTTP', 'SECURE', 'JSON')),
+            provider_system,
+            method,
+            lambda: None,
+    )
+    replacement_rule = RegistrationRule(consumed_service, provider_system, 'POST', lambda: None)
+
+    rule_container.store(first_rule)
+    rule_container.store(other_rule)
+    rule_container.store(replacement_rule)
+
+    assert len(rule_container) == 2
+    assert list(rule_container) == [replacement_rule, other_rule]
+    assert rule_container.retrieve('test') is replacement_rule
+
+
+def test_registration_rule_unregistration_payload():
+    rule = RegistrationRule(consumed_service, provider_system, method, lambda: None)
+
+    assert rule.unregistration_payload == {
+        'service_definition': consumed_service.service_definition,
+        'system_name': provider_system.system_name,
+        'address': provider_system.address,
+        'port': provider_system.port,
+    }
+    assert rule.unregistration_query == 'service_definition=test&system_name=test&address=127.0.0.1&port=1337'
@@ -1,6 +1,10 @@
+import json
+from datetime import datetime, timedelta
+
 import pytest
 
 import arrowhead_client.dto
+from arrowhead_client.service import ServiceInterface
 
 
 to_snake_case_list = [
@@ -42,4 +46,31 @@ camel_case_true_list = [
 @pytest.mark.parametrize('test,expected', zip(to_camel_case_list, camel_case_true_list))
 def test_to_camel_case(test, expected):
     test = arrowhead_client.dto.to_camel_case(test)
-    assert test == expected
\ No newline at end of file
+    assert test == expected
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_service_interface_json_encoding(use_orjson, monkeypatch):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(arrowhead_client.dto, 'orjson', None)
+
+    class InterfaceForm(arrowhead_client.dto.DTOMixin):
+        interface: ServiceInterface
+        created_at: datetime
+        valid_for: timedelta
+
+    form = InterfaceForm(
+            interface=ServiceInterface('HTTP', 'SECURE', 'JSON'),
+            created_at=datetime(2021, 1, 1, 12, 30),
+            valid_for=timedelta(minutes=1),
+    )
+    expected = {
+        'interface': 'HTTP-SECURE-JSON',
+        'createdAt': '2021-01-01T12:30:00',
+        'validFor': 'P0DT0H1M0.000000S',
+    }
+
+    assert json.loads(form.json()) == expected
+    assert json.loads(form.dto_bytes()) == expected
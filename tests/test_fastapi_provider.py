@@ -0,0 +1,166 @@
+import asyncio
+import json
+
+from arrowhead_client.provider.implementations.fastapi_provider import (
+    ArrowheadAccessPolicyASGI,
+    FastapiProvider,
+)
+from arrowhead_client.rules import RegistrationRule
+from arrowhead_client.security.access_policy import (
+    AccessPolicy,
+    TokenAccessPolicy,
+    UnrestrictedAccessPolicy,
+)
+from arrowhead_client.service import Service
+from arrowhead_client.system import ArrowheadSystem
+
+provider_system = ArrowheadSystem.make('test_system', '127.0.0.1', 1337)
+
+
+class DenyAccessPolicy(AccessPolicy):
+    def is_authorized(self, *args, **kwargs) -> bool:
+        return False
+
+
+def make_rule(service_definition, access_policy, protocol='HTTP', func=None, method='GET'):
+    service = Service.make(service_definition, service_definition, protocol, 'NOT_SECURE', 'JSON')
+
+    return RegistrationRule(
+            service,
+            provider_system,
+            method,
+            func or (lambda: {'msg': 'hello'}),
+            access_policy,
+    )
+
+
+def http_request(app, path, method='GET', body=b''):
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        'type': 'http',
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'root_path': '',
+        'query_string': b'',
+        'headers': [(b'content-type', b'application/json')],
+        'server': ('127.0.0.1', 1337),
+    }
+    asyncio.run(app(scope, receive, send))
+
+    return messages[0]['status'], json.loads(messages[1]['body'])
+
+
+def test_access_policy_authorized():
+    provider = FastapiProvider('')
+    provider.add_provided_service(make_rule('hello', UnrestrictedAccessPolicy()))
+
+    assert http_request(provider.app, '/hello') == (200, {'msg': 'hello'})
+
+
+def test_access_policy_not_authorized():
+    provider = FastapiProvider('')
+    provider.add_provided_service(make_rule('hello', DenyAccessPolicy()))
+
+    assert http_request(provider.app, '/hello') == (403, {'errorMessage': 'WIP'})
+
+
+def test_access_policy_checked_before_body_is_parsed():
+    async def echo(data: dict):
+        return data
+
+    provider = FastapiProvider('')
+    provider.add_provided_service(make_rule('echo', DenyAccessPolicy(), func=echo, method='POST'))
+
+    assert http_request(provider.app, '/echo', 'POST', b'{bad') == (403, {'errorMessage': 'WIP'})
+
+
+def test_access_policy_token_not_supported():
+    provider = FastapiProvider('')
+    service = Service.make('hello', 'hello', 'HTTP', 'TOKEN', 'JSON')
+    provider.add_provided_service(make_rule('hello', TokenAccessPolicy(service, '', '')))
+
+    assert http_request(provider.app, '/hello') == (
+        501,
+        {'errorMessage': 'Token access policy not supported'},
+    )
+
+
+class RecordingApp:
+    def __init__(self):
+        self.scopes = []
+
+    async def __call__(self, scope, receive, send):
+        self.scopes.append(scope)
+
+
+def call_middleware(middleware, scope_type, path):
+    messages = []
+
+    async def receive():
+        return {'type': 'websocket.connect'}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware({'type': scope_type, 'path': path}, receive, send))
+
+    return messages
+
+
+def test_access_policy_middleware_denies_websocket():
+    app = RecordingApp()
+    middleware = ArrowheadAccessPolicyASGI(app, {'ws': make_rule('ws', DenyAccessPolicy(), 'WS')})
+
+    messages = call_middleware(middleware, 'websocket', '/ws')
+
+    assert messages == [{'type': 'websocket.close', 'code': 1008}]
+    assert app.scopes == []
+
+
+def test_access_policy_middleware_passes_authorized_websocket():
+    app = RecordingApp()
+    middleware = ArrowheadAccessPolicyASGI(app, {'ws': make_rule('ws', UnrestrictedAccessPolicy(), 'WS')})
+
+    messages = call_middleware(middleware, 'websocket', '/ws')
+
+    assert messages == []
+    assert len(app.scopes) == 1
+
+
+def test_access_policy_middleware_denies_http():
+    app = RecordingApp()
+    middleware = ArrowheadAccessPolicyASGI(app, {'hello': make_rule('hello', DenyAccessPolicy())})
+
+    messages = call_middleware(middleware, 'http', '/hello')
+
+    assert messages[0]['status'] == 403
+    assert json.loads(messages[1]['body']) == {'errorMessage': 'WIP'}
+    assert app.scopes == []
+
+
+def test_access_policy_middleware_passes_other_scopes():
+    app = RecordingApp()
+    middleware = ArrowheadAccessPolicyASGI(app, {'hello': make_rule('hello', DenyAccessPolicy())})
+
+    call_middleware(middleware, 'lifespan', '/hello')
+
+    assert [scope['type'] for scope in app.scopes] == ['lifespan']
+
+
+def test_access_policy_middleware_passes_unknown_path():
+    app = RecordingApp()
+    middleware = ArrowheadAccessPolicyASGI(app, {'ws': make_rule('ws', DenyAccessPolicy(), 'WS')})
+
+    messages = call_middleware(middleware, 'websocket', '/other')
+
+    assert messages == []
+    assert [scope['path'] for scope in app.scopes] == ['/other']
@@ -1,3 +1,8 @@
+import json
+
+import pytest
+
+import arrowhead_client.dto
 from arrowhead_client.system import ArrowheadSystem
 from arrowhead_client.service import Service, ServiceInterface
 from arrowhead_client.constants import OrchestrationFlags
@@ -69,3 +74,28 @@ def test_orchestration_form():
     }
 
     assert set(orchestration_form.dto().keys()) == valid_keys
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_dto_bytes(use_orjson, monkeypatch):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(arrowhead_client.dto, 'orjson', None)
+
+    registration_form = forms.ServiceRegistrationForm.make(
+            provided_service=provided_service,
+            provider_system=provider_system,
+            end_of_validity='dummy-date',
+    )
+
+    assert json.loads(registration_form.dto_bytes()) == {
+        'serviceDefinition': 'test_service',
+        'serviceUri': '/test/test/test',
+        'interfaces': ['HTTP-SECURE-JSON'],
+        'providerSystem': {'systemName': 'test_system', 'address': 'localhost', 'port': 0},
+        'secure': 'CERTIFICATE',
+        'metadata': {'dummy': 'data'},
+        'version': 0,
+        'endOfValidity': 'dummy-date',
+    }